@@ -2,9 +2,9 @@ import streamlit as st
 import os 
 import datetime
 import shutil
-import pandas as pd
 from streamlit_pdf_viewer import pdf_viewer
 from main import main  # Importer la fonction main du module main_script2
+from keyword_registry import KEYWORDS_CSV, archive_path_parts, get_registry
 import base64
 
 TMP_DIR = "tmp"
@@ -15,15 +15,20 @@ def process_file(pdf_path):
     return result
 
 def get_majors():
-    csv_path = "majors_keywords.csv"
+    csv_path = KEYWORDS_CSV
     if os.path.exists(csv_path):
-        majors_df = pd.read_csv(csv_path)
-        major_list = majors_df['Major'].dropna().unique().tolist()
+        # Registre mis en cache : le CSV n'est relu que s'il a été modifié
+        major_list = get_registry(csv_path)['majors']
     else:
         st.error(f"Le fichier {csv_path} est introuvable.")
         major_list = []
     return major_list
 
+def get_archive_paths():
+    if os.path.exists(KEYWORDS_CSV):
+        return get_registry(KEYWORDS_CSV)['archive_paths']
+    return {}
+
 # Fonction pour afficher le dashboard
 def dashboard():
     st.title("Dashboard")
@@ -66,34 +71,30 @@ def dashboard():
         st.write("Fin du traitement. Vous pouvez consulter les détails de chaque classement des offres.")
 
 # Fonction pour gérer le déplacement ou la copie des fichiers
-def handle_file_movement(pdf_file, result, classifications, keywords):
+def handle_file_movement(pdf_file, result, classifications, archive_paths):
     old_pdf_path = os.path.join(TMP_DIR, pdf_file)
     for classification_name in classifications:
-        classification_parts = classification_name.upper().split()
-
-        # Trouver le mot-clé dans la classification
-        for keyword in keywords:
-            if keyword in classification_parts:
-                keyword_index = classification_parts.index(keyword)
-                classification_sub_name = "_".join(classification_parts[keyword_index + 1:])
-                
-                # Construire le chemin du répertoire
-                directory_path = os.path.join(
-                    "OFFRES",
-                    result['type_contrat'].upper(),
-                    *classification_parts[:keyword_index],
-                    classification_parts[keyword_index],
-                    classification_sub_name.upper()
-                )
-                os.makedirs(directory_path, exist_ok=True)
-
-                # Déplacer ou copier le fichier
-                final_path = os.path.join(directory_path, pdf_file)
-                try:
-                    shutil.copy2(old_pdf_path, final_path)
-                    st.success(f"Le fichier {pdf_file} a été copié vers {final_path}")
-                except Exception as e:
-                    st.error(f"Erreur lors de la copie de {pdf_file} vers {final_path} : {e}")
+        # Chemins d'archive précalculés par le registre, sinon calculés à la volée
+        paths = archive_paths.get(classification_name.upper())
+        if paths is None:
+            paths = archive_path_parts(classification_name)
+
+        for path_parts in paths:
+            # Construire le chemin du répertoire
+            directory_path = os.path.join(
+                "OFFRES",
+                result['type_contrat'].upper(),
+                *path_parts
+            )
+            os.makedirs(directory_path, exist_ok=True)
+
+            # Déplacer ou copier le fichier
+            final_path = os.path.join(directory_path, pdf_file)
+            try:
+                shutil.copy2(old_pdf_path, final_path)
+                st.success(f"Le fichier {pdf_file} a été copié vers {final_path}")
+            except Exception as e:
+                st.error(f"Erreur lors de la copie de {pdf_file} vers {final_path} : {e}")
 
 # Fonction principale pour afficher les offres classées
 def classified_offers():
@@ -112,7 +113,8 @@ def classified_offers():
             st.session_state.classified_files = {pdf_file: False for pdf_file in results.keys()}
 
         classifying_done = all(st.session_state.classified_files.values())
-        keywords = ["MASTER", "BACHELOR", "MASTÈRE","MBA"]
+        major_list = get_majors()
+        archive_paths = get_archive_paths()
 
         # Parcourir chaque fichier
         for pdf_file, result in results.items():
@@ -138,7 +140,6 @@ def classified_offers():
                     if st.checkbox(f"Utiliser l'autre classification : {classification}", key=f"{pdf_file}_{classification}"):
                         selected_classifications.append(classification.upper())
                 # Ajouter une liste déroulante pour choisir une classification supplémentaire
-                major_list = get_majors()
                 selected_major = st.selectbox(
                     "Voir plus :", 
                     options=["Aucun"] + major_list, 
@@ -170,7 +171,7 @@ def classified_offers():
                     if isinstance(classification_data, list)
                     else [classification_data.upper()]
                 )
-                handle_file_movement(pdf_file, result, classifications, keywords)
+                handle_file_movement(pdf_file, result, classifications, archive_paths)
             # Supprimer le dossier temporaire
             if os.path.exists(TMP_DIR):
                 shutil.rmtree(TMP_DIR)
@@ -207,7 +208,7 @@ def classified_offers():
                     if not selected_classifications:
                         st.warning(f"Aucune classification sélectionnée pour {pdf_file}.")
                         continue
-                    handle_file_movement(pdf_file, result, selected_classifications, keywords)
+                    handle_file_movement(pdf_file, result, selected_classifications, archive_paths)
                 
                 # Cleanup
                 if os.path.exists("tmp"):
@@ -0,0 +1,265 @@
+# bulk_reclassify.py
+import argparse
+import json
+import os
+import time
+from multiprocessing import Pool
+from document_classifier import classify_pdf
+from keyword_registry import KEYWORDS_CSV, TYPES_CONTRATS, get_registry, model_version
+from text_preprocessor import verify_nltk_data
+
+DEFAULT_ROOTS = ["OFFRES", "EMLV"]
+DEFAULT_OUTPUT = "reclassification.jsonl"
+DEFAULT_CHECKPOINT_EVERY = 25
+MAX_ATTEMPTS = 3
+
+def find_pdfs(roots: list) -> list:
+    """
+    Recursively list the PDF files under the given directories.
+
+    Args:
+        roots (list): Directories to walk
+
+    Returns:
+        list: Sorted PDF paths
+    """
+    pdf_paths = []
+    for root in roots:
+        if not os.path.isdir(root):
+            print(f"The path {root} doesn't exist, skipped.")
+            continue
+        for dirpath, _, filenames in os.walk(root):
+            for filename in filenames:
+                if filename.lower().endswith('.pdf'):
+                    pdf_paths.append(os.path.join(dirpath, filename))
+    return sorted(pdf_paths)
+
+def document_key(pdf_path: str) -> str:
+    """
+    Identify a document by its path, size and modification time so that
+    edited files are reclassified on the next run.
+    """
+    stat = os.stat(pdf_path)
+    return f"{pdf_path}|{stat.st_size}|{stat.st_mtime_ns}"
+
+def is_current(key: str) -> bool:
+    """
+    Tell whether a document key still describes a file on disk, i.e. the file
+    was neither deleted nor edited since the key was recorded.
+    """
+    pdf_path = key.rsplit("|", 2)[0]
+    return os.path.exists(pdf_path) and document_key(pdf_path) == key
+
+def load_journal(journal_path: str, version: str) -> dict:
+    """
+    Load the checkpoint journal of a previous run.
+
+    Args:
+        journal_path (str): Path to the journal file
+        version (str): Current model version (see keyword_registry.model_version)
+
+    Returns:
+        dict: Journal with the completed document keys, the failure count of
+        the documents that could not be classified and the size of the results
+        file at the last checkpoint, or None if it is missing or was written
+        for another model version
+    """
+    if os.path.exists(journal_path):
+        with open(journal_path, 'r', encoding='utf-8') as file:
+            journal = json.load(file)
+        if journal.get("model_version") == version:
+            journal.setdefault("failed", {})
+            return journal
+        print("Keywords or classifier code have changed since the last run, starting over.")
+    return None
+
+def save_journal(journal_path: str, journal: dict) -> None:
+    # Write then rename so a crash never leaves a half-written journal
+    tmp_path = journal_path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as file:
+        json.dump(journal, file)
+    os.replace(tmp_path, journal_path)
+
+def load_results(output_path: str) -> dict:
+    """
+    Read a results file, keeping only the last line written for each file.
+
+    Args:
+        output_path (str): JSONL results file
+
+    Returns:
+        dict: Latest result of each PDF path
+    """
+    results = {}
+    with open(output_path, 'r', encoding='utf-8') as file:
+        for line in file:
+            if line.strip():
+                result = json.loads(line)
+                results[result["file"]] = result
+    return results
+
+def move_aside(output_path: str) -> str:
+    # Keep results that no journal describes instead of overwriting them
+    backup_path = f"{output_path}.{time.strftime('%Y%m%d-%H%M%S')}.bak"
+    os.replace(output_path, backup_path)
+    print(f"Previous results of {output_path} moved to {backup_path}.")
+    return backup_path
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"{value} is not a positive integer")
+    return number
+
+def _init_worker(csv_path: str) -> None:
+    global _majeures
+    _majeures = get_registry(csv_path)['keywords']
+
+def _classify_worker(task: tuple) -> tuple:
+    key, pdf_path = task
+    result = {"file": pdf_path, "directory": os.path.basename(os.path.dirname(pdf_path))}
+    try:
+        classification = classify_pdf(pdf_path, _majeures, TYPES_CONTRATS)
+        result.update({
+            "type_contrat": classification['type_contrat'],
+            "top_category": classification['top_category'],
+            "top_3_scores": [[major, float(score)] for major, score in classification['sorted_scores'][:3]]
+        })
+    except Exception as e:
+        result["error"] = str(e)
+    return key, result
+
+def format_duration(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:d}:{minutes:02d}:{seconds:02d}"
+
+def reclassify_archive(roots: list, output_path: str = DEFAULT_OUTPUT, journal_path: str = None,
+                       processes: int = None, checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+                       csv_path: str = KEYWORDS_CSV, restart: bool = False, retry_failed: bool = False) -> int:
+    """
+    Reclassify every PDF under the given directories, resuming from the
+    journal of a previous (possibly interrupted) run.
+
+    Results are appended to a JSONL file as they arrive. Every
+    `checkpoint_every` documents the journal records the completed documents
+    and the size of the results file, so that on resume the lines written
+    after the last checkpoint are dropped and those documents redone.
+
+    The journal is tied to the model version (keywords CSV content and code
+    revision): when either changes, or with `restart`, every document is
+    classified again. An existing output file without a matching journal is
+    moved aside rather than overwritten.
+
+    Documents whose classification failed are written with an "error" field
+    and retried on the next runs, up to MAX_ATTEMPTS failures unless
+    `retry_failed` is set. Edited or retried documents get a new line: the
+    output may contain superseded lines for a file, the last one wins (see
+    load_results), and results of deleted files are kept.
+
+    Args:
+        roots (list): Directories to walk recursively
+        output_path (str): JSONL file receiving one result per document
+        journal_path (str): Checkpoint journal (default: <output_path>.journal)
+        processes (int): Number of worker processes (default: CPU count)
+        checkpoint_every (int): Number of documents between checkpoints
+        csv_path (str): Path to the keywords CSV
+        restart (bool): Ignore the journal and classify every document again
+        retry_failed (bool): Retry documents that reached MAX_ATTEMPTS failures
+
+    Returns:
+        int: Number of documents classified during this run
+    """
+    if checkpoint_every < 1:
+        raise ValueError(f"checkpoint_every must be at least 1, got {checkpoint_every}")
+    journal_path = journal_path or output_path + ".journal"
+    version = model_version(csv_path)
+    journal = None if restart else load_journal(journal_path, version)
+    output_size = os.path.getsize(output_path) if os.path.exists(output_path) else 0
+
+    if journal is not None and output_size < journal["results_offset"]:
+        print(f"{output_path} is shorter than recorded in the journal, starting over.")
+        journal = None
+    if journal is None:
+        if output_size:
+            move_aside(output_path)
+        journal = {"model_version": version, "done": [], "failed": {}, "results_offset": 0}
+    elif os.path.exists(output_path):
+        # Drop results written after the last checkpoint
+        with open(output_path, 'r+b') as file:
+            file.truncate(journal["results_offset"])
+
+    # Forget documents that were edited or deleted since they were classified
+    done = {key for key in journal["done"] if is_current(key)}
+    failed = {key: attempts for key, attempts in journal["failed"].items() if is_current(key)}
+
+    tasks = []
+    given_up = 0
+    for path in find_pdfs(roots):
+        key = document_key(path)
+        if key in done:
+            continue
+        if failed.get(key, 0) >= MAX_ATTEMPTS and not retry_failed:
+            given_up += 1
+            continue
+        tasks.append((key, path))
+    total = len(tasks)
+    print(f"{len(done)} documents already classified, {given_up} given up after {MAX_ATTEMPTS} failures "
+          f"(use --retry-failed), {total} to process.")
+    if not tasks:
+        journal.update(done=sorted(done), failed=failed)
+        save_journal(journal_path, journal)
+        return 0
+
+    start = time.time()
+    processed = errors = 0
+    with open(output_path, 'a', encoding='utf-8') as output, \
+            Pool(processes, initializer=_init_worker, initargs=(csv_path,)) as pool:
+        for key, result in pool.imap_unordered(_classify_worker, tasks):
+            output.write(json.dumps(result, ensure_ascii=False) + "\n")
+            if "error" in result:
+                errors += 1
+                failed[key] = failed.get(key, 0) + 1
+            else:
+                done.add(key)
+                failed.pop(key, None)
+            processed += 1
+
+            if processed % checkpoint_every == 0 or processed == total:
+                output.flush()
+                os.fsync(output.fileno())
+                journal.update(done=sorted(done), failed=failed)
+                journal["results_offset"] = os.fstat(output.fileno()).st_size
+                save_journal(journal_path, journal)
+
+                elapsed = time.time() - start
+                rate = processed / elapsed if elapsed else 0.0
+                eta = (total - processed) / rate if rate else 0.0
+                print(f"[{processed}/{total}] {rate:.2f} docs/s, {errors} errors, "
+                      f"elapsed {format_duration(elapsed)}, ETA {format_duration(eta)}")
+
+    return processed
+
+def main():
+    parser = argparse.ArgumentParser(description="Reclassify the whole offers archive.")
+    parser.add_argument("roots", nargs="*", default=DEFAULT_ROOTS,
+                        help="Directories to walk recursively (default: OFFRES EMLV)")
+    parser.add_argument("-o", "--output", default=DEFAULT_OUTPUT, help="JSONL results file")
+    parser.add_argument("--journal", default=None, help="Checkpoint journal (default: <output>.journal)")
+    parser.add_argument("-j", "--processes", type=int, default=None, help="Number of worker processes")
+    parser.add_argument("--checkpoint-every", type=positive_int, default=DEFAULT_CHECKPOINT_EVERY,
+                        help="Number of documents between checkpoints")
+    parser.add_argument("--restart", action="store_true",
+                        help="Ignore the journal and classify every document again")
+    parser.add_argument("--retry-failed", action="store_true",
+                        help=f"Retry documents that failed {MAX_ATTEMPTS} times")
+    args = parser.parse_args()
+
+    # Check nltk install
+    verify_nltk_data()
+
+    reclassify_archive(args.roots, args.output, args.journal, args.processes, args.checkpoint_every,
+                       restart=args.restart, retry_failed=args.retry_failed)
+
+if __name__ == "__main__":
+    main()
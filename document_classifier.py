@@ -3,7 +3,7 @@ from pdf_processor import extract_text_from_pdf
 from text_preprocessor import preprocess_text
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
-from pdf_processor import extract_text_from_pdf, pdf_to_text_via_ocr
+from pdf_processor import extract_text_from_pdf, pdf_to_text_via_ocr, pdf_title
 import os
 
 def count_preprocessed_keywords(preprocessed_tokens: list, keywords: list) -> int:
@@ -68,19 +68,20 @@ def find_matching_keywords(preprocessed_tokens: list, keywords: list) -> list:
     
     return matched_keywords
 
-def classify_type(extracted_text: str, categories: dict) -> dict:
+def classify_type(extracted_text: str, categories: dict, tokenizer: str = 'nltk') -> dict:
     """
     Classify a PDF document based on predefined categories and their keywords.
     
     Args:
         extracted_text (str): Text of the file
         categories (dict): Dictionary of categories and their keywords
+        tokenizer (str): Tokenizer used by preprocess_text ('nltk' or 'regex')
         
     Returns:
         tuple: (category, matched_keywords)
     """
     # Preprocess text
-    preprocessed_tokens = preprocess_text(extracted_text)
+    preprocessed_tokens = preprocess_text(extracted_text, tokenizer)
     
     # Calculate scores for each category
     scores = {}
@@ -97,7 +98,25 @@ def classify_type(extracted_text: str, categories: dict) -> dict:
         
     return max(scores, key=scores.get), matched_keywords
 
-def classify_majeurs_tfidf(extracted_text: str, categories: dict, interval: float = 0):
+def fit_category_model(categories: dict, max_features: int = 500) -> tuple:
+    """
+    Fit a TF-IDF model on the category keywords only, so that it can be reused
+    across documents instead of being refitted for each of them.
+    
+    Args:
+        categories (dict): Dictionary of major categories and their keywords.
+        max_features (int): Maximum size of the TF-IDF vocabulary.
+        
+    Returns:
+        tuple: (fitted vectorizer, TF-IDF matrix of the categories)
+    """
+    category_texts = [" ".join(categories[cat]) for cat in categories]
+    vectorizer = TfidfVectorizer(ngram_range=(1, 3), max_features=max_features)
+    category_vectors = vectorizer.fit_transform(category_texts)
+    return vectorizer, category_vectors
+
+def classify_majeurs_tfidf(extracted_text: str, categories: dict, interval: float = 0,
+                           max_features: int = 500, tokenizer: str = 'nltk', model: tuple = None):
     """
     Classify a document into multiple major categories using TF-IDF and cosine similarity,
     with preprocessing applied to both extracted text and category keywords.
@@ -106,6 +125,10 @@ def classify_majeurs_tfidf(extracted_text: str, categories: dict, interval: floa
         extracted_text (str): Raw text extracted from the document.
         categories (dict): Dictionary of major categories and their keywords.
         interval (float): Threshold interval for classification.
+        max_features (int): Maximum size of the TF-IDF vocabulary.
+        tokenizer (str): Tokenizer used by preprocess_text ('nltk' or 'regex').
+        model (tuple): Model returned by fit_category_model; if None, a model is
+            fitted on the categories and the document together.
         
     Returns:
         tuple: 
@@ -114,19 +137,24 @@ def classify_majeurs_tfidf(extracted_text: str, categories: dict, interval: floa
             - dict: Dictionary of matched keywords for each category.
     """
     # Prétraiter le texte extrait
-    preprocessed_text = preprocess_text(extracted_text)
-    
-    category_texts = [" ".join(categories[cat]) for cat in categories]
+    preprocessed_text = preprocess_text(extracted_text, tokenizer)
     document_text = " ".join(preprocessed_text)
-    texts = category_texts + [document_text]
 
-    # Calculer les représentations TF-IDF
-    vectorizer = TfidfVectorizer(min_df=2, ngram_range=(1, 3), max_features=500)
-    tfidf_matrix = vectorizer.fit_transform(texts)
+    if model is not None:
+        # Réutiliser le modèle déjà ajusté sur les catégories
+        vectorizer, category_vectors = model
+        document_vector = vectorizer.transform([document_text])
+    else:
+        category_texts = [" ".join(categories[cat]) for cat in categories]
+        texts = category_texts + [document_text]
 
-    # Séparer les matrices TF-IDF 
-    category_vectors = tfidf_matrix[:-1]  # Tous sauf le dernier (catégories)
-    document_vector = tfidf_matrix[-1]  # Le dernier (document extrait)
+        # Calculer les représentations TF-IDF
+        vectorizer = TfidfVectorizer(min_df=2, ngram_range=(1, 3), max_features=max_features)
+        tfidf_matrix = vectorizer.fit_transform(texts)
+
+        # Séparer les matrices TF-IDF 
+        category_vectors = tfidf_matrix[:-1]  # Tous sauf le dernier (catégories)
+        document_vector = tfidf_matrix[-1]  # Le dernier (document extrait)
 
     # Créer un dictionnaire pour stocker les mots-clés correspondants
     matched_keywords = {category: [] for category in categories.keys()}
@@ -154,6 +182,66 @@ def classify_majeurs_tfidf(extracted_text: str, categories: dict, interval: floa
     return top_categories, scores, matched_keywords_non_vides
 
 
+def directory_target(directory_name: str) -> str:
+    """
+    Derive the expected major label from an archive directory name
+    (e.g. "DIA - DATA ET INTELLIGENCE ARTIFICIELLE" -> "DATA ET INTELLIGENCE ARTIFICIELLE").
+    
+    Args:
+        directory_name (str): Name of the directory containing the PDF.
+        
+    Returns:
+        str: Upper-cased label to look for in the predicted major.
+    """
+    target = directory_name if "-" not in directory_name else directory_name.split("-")[1]
+    return target.strip().upper()
+
+
+def classify_pdf(pdf_path: str, majeures: dict, types_contrats: dict, use_ocr: bool = True,
+                 max_features: int = 500, tokenizer: str = 'nltk', model: tuple = None) -> dict:
+    """
+    Extract the text of a PDF and classify its contract type and major.
+    
+    Args:
+        pdf_path (str): Path to the PDF file.
+        majeures (dict): Dictionary of majors and their keywords.
+        types_contrats (dict): Dictionary of contract types and their keywords.
+        use_ocr (bool): Fall back to OCR when the PDF has no text layer.
+        max_features (int): Maximum size of the TF-IDF vocabulary.
+        tokenizer (str): Tokenizer used by preprocess_text ('nltk' or 'regex').
+        model (tuple): Optional model returned by fit_category_model.
+        
+    Returns:
+        dict: Contract type, top category, scores sorted in descending order
+        and matched keywords.
+    """
+    # Extract text from the PDF
+    extracted_text = extract_text_from_pdf(pdf_path)
+    if not extracted_text and use_ocr:
+        extracted_text = pdf_to_text_via_ocr(pdf_path)
+    if not extracted_text:
+        # Neither a text layer nor OCR output: classify on the file name
+        extracted_text = pdf_title(pdf_path)
+
+    # Classify contract type
+    type_contrat, _ = classify_type(extracted_text, types_contrats, tokenizer)
+
+    # Classify major using TF-IDF
+    _, scores, matched_keywords = classify_majeurs_tfidf(
+        extracted_text, majeures, max_features=max_features, tokenizer=tokenizer, model=model
+    )
+
+    # Sort scores in descending order
+    sorted_scores = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+
+    return {
+        "type_contrat": type_contrat,
+        "top_category": sorted_scores[0][0] if sorted_scores else "Unclassified",
+        "sorted_scores": sorted_scores,
+        "matched_keywords": matched_keywords
+    }
+
+
 def classify_pdfs_in_directory(directory_path: str, majeures: dict, types_contrats: dict):
     """
     Classify all PDFs in a directory and verify the top category.
@@ -175,23 +263,14 @@ def classify_pdfs_in_directory(directory_path: str, majeures: dict, types_contra
         print(f"\nProcessing: {pdf_file}")
         
         try:
-            # Extract text from the PDF
-            extracted_text = extract_text_from_pdf(pdf_path) or pdf_to_text_via_ocr(pdf_path)
-
-            # Classify contract type
-            type_contrat, _ = classify_type(extracted_text, types_contrats)
-            print(f"Classified contract type: {type_contrat}")
-
-            # Classify major using TF-IDF
-            _, scores, matched_keywords = classify_majeurs_tfidf(extracted_text, majeures)
-            print(matched_keywords)
-            # Sort scores in descending order
-            sorted_scores = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+            classification = classify_pdf(pdf_path, majeures, types_contrats)
+            print(f"Classified contract type: {classification['type_contrat']}")
+            print(classification['matched_keywords'])
+            sorted_scores = classification['sorted_scores']
             
             # Check if the top category matches the directory name
-            top_category = sorted_scores[0][0] if sorted_scores else "Unclassified"
-            target = directory_name if "-" not in directory_name else directory_name.split("-")[1]
-            is_match = (target.strip().upper() in top_category)  # Utiliser le nom du répertoire
+            top_category = classification['top_category']
+            is_match = (directory_target(directory_name) in top_category)  # Utiliser le nom du répertoire
             
             # Print results
             print(f"Top category: {top_category}")
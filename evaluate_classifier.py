@@ -0,0 +1,232 @@
+# evaluate_classifier.py
+import argparse
+import datetime
+import json
+import multiprocessing
+import os
+import sys
+import time
+from document_classifier import classify_pdf, fit_category_model
+from keyword_registry import KEYWORDS_CSV, TYPES_CONTRATS, code_version, get_registry
+from text_preprocessor import verify_nltk_data
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+DATASET_DIR = os.path.join("EMLV", "EMLV", "ALTERNANCES")
+RESULTS_PATH = "evaluation_results.jsonl"
+
+# Major expected for each folder of the archive; folders without a major in
+# majors_keywords.csv (e.g. "MCDD -Management & conseil en dev durable") are left out
+FOLDER_MAJORS = {
+    "DIB - EMLV BACHELOR DIGITAL & INTERNATIONAL BUSINESS": "EMLV BACHELOR DIGITAL & INTERNATIONAL BUSINESS",
+    "DMDA- DIGITAL MARKETING DATA ANALYST": "EMLV MASTER DIGITAL MARKETING & DATA ANALYTICS",
+    "EMLV MASTER DIGITAL RH": "EMLV MASTER DIGITAL RH",
+    "FCG- Finance controle de gestion": "EMLV MASTER FINANCE & CONTRÔLE DE GESTION",
+    "MEC - MARKETING & EXPERIENCE CLIENT": "EMLV MASTER MARKETING & EXPERIENCE CLIENT",
+    "MSID -MANAGEMENT DES SYSTEM D'INFO ET DES DATA": "EMLV MASTER MANAGEMENT DES SYSTÈMES D'INFORMATION ET DES DATA",
+    "NDC- Negotiation developpement commercial": "EMLV MASTER NÉGOCIATION & MANAGEMENT DES AFFAIRES",
+}
+
+# Pipeline configurations to compare, passed as options to classify_pdf
+VARIANTS = {
+    "baseline": {},
+    "no_ocr": {"use_ocr": False},
+    "max_features_200": {"max_features": 200},
+    "regex_tokenizer": {"tokenizer": "regex"},
+    "cached_model": {"cached_model": True},
+    "fast": {"use_ocr": False, "tokenizer": "regex", "cached_model": True},
+}
+
+def build_labeled_set(dataset_dir: str = DATASET_DIR, csv_path: str = KEYWORDS_CSV) -> tuple:
+    """
+    Build the labeled set from the archive layout <dataset_dir>/<FOLDER>/*.pdf,
+    using FOLDER_MAJORS as ground truth.
+
+    Args:
+        dataset_dir (str): Directory containing one sub-directory per major
+        csv_path (str): Path to the keywords CSV
+
+    Returns:
+        tuple: (pdf_path, expected major) tuples, and the number of PDFs left
+        out because their folder could not be mapped to a known major
+    """
+    majors = set(get_registry(csv_path)['majors'])
+    labeled_set = []
+    skipped = 0
+
+    for directory_name in sorted(os.listdir(dataset_dir)):
+        directory_path = os.path.join(dataset_dir, directory_name)
+        if not os.path.isdir(directory_path):
+            continue
+        pdf_paths = [os.path.join(directory_path, pdf_file) for pdf_file in sorted(os.listdir(directory_path))
+                     if pdf_file.lower().endswith('.pdf')]
+
+        major = FOLDER_MAJORS.get(directory_name)
+        if major not in majors:
+            reason = "no major mapped" if major is None else f"unknown major '{major}'"
+            print(f"Warning: {directory_name} skipped ({reason}), {len(pdf_paths)} PDFs left out.")
+            skipped += len(pdf_paths)
+            continue
+
+        labeled_set.extend((pdf_path, major) for pdf_path in pdf_paths)
+
+    return labeled_set, skipped
+
+def peak_rss_mb(who: int) -> float:
+    """
+    Return the peak resident memory in MB of the current process
+    (resource.RUSAGE_SELF) or of its largest finished child process
+    (resource.RUSAGE_CHILDREN), or None where resource is unavailable.
+    """
+    if resource is None:
+        return None
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+    unit = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return resource.getrusage(who).ru_maxrss / unit
+
+def run_variant(options: dict, labeled_set: list, csv_path: str = KEYWORDS_CSV) -> dict:
+    """
+    Classify the labeled set with one pipeline configuration.
+
+    Args:
+        options (dict): Options of the variant (see VARIANTS)
+        labeled_set (list): (pdf_path, expected major) tuples
+        csv_path (str): Path to the keywords CSV
+
+    Returns:
+        dict: Accuracy, throughput and memory metrics
+    """
+    options = dict(options)
+    majeures = get_registry(csv_path)['keywords']
+
+    start = time.perf_counter()
+    if options.pop("cached_model", False):
+        options["model"] = fit_category_model(majeures, options.get("max_features", 500))
+
+    top1 = top3 = errors = 0
+    for pdf_path, target in labeled_set:
+        try:
+            classification = classify_pdf(pdf_path, majeures, TYPES_CONTRATS, **options)
+        except Exception as e:
+            print(f"Error processing {pdf_path}: {e}")
+            errors += 1
+            continue
+        top_categories = [major for major, _ in classification['sorted_scores'][:3]]
+        top1 += bool(top_categories) and top_categories[0] == target
+        top3 += target in top_categories
+    elapsed = time.perf_counter() - start
+
+    total = len(labeled_set)
+    return {
+        "documents": total,
+        "errors": errors,
+        "top1_accuracy": top1 / total if total else 0.0,
+        "top3_accuracy": top3 / total if total else 0.0,
+        "docs_per_sec": total / elapsed if elapsed else 0.0,
+        "seconds": elapsed,
+        # Python process running the variant, and external tools it started
+        # (tesseract, pdftoppm for OCR)
+        "peak_rss_mb": peak_rss_mb(resource.RUSAGE_SELF) if resource else None,
+        "peak_children_rss_mb": peak_rss_mb(resource.RUSAGE_CHILDREN) if resource else None,
+    }
+
+def run_variant_isolated(options: dict, labeled_set: list, csv_path: str = KEYWORDS_CSV) -> dict:
+    # A fresh process per variant so that peak memory and warm caches are not shared
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(1) as pool:
+        return pool.apply(run_variant, (options, labeled_set, csv_path))
+
+def load_previous_results(results_path: str) -> dict:
+    """
+    Return the latest stored metrics of each variant.
+    """
+    previous = {}
+    if os.path.exists(results_path):
+        with open(results_path, 'r', encoding='utf-8') as file:
+            for line in file:
+                if line.strip():
+                    record = json.loads(line)
+                    previous[record["variant"]] = record
+    return previous
+
+def format_delta(value: float, previous: dict, key: str) -> str:
+    if previous is None or previous.get(key) is None or value is None:
+        return ""
+    return f" ({value - previous[key]:+.2f})"
+
+def evaluate(variant_names: list, dataset_dir: str = DATASET_DIR, results_path: str = RESULTS_PATH,
+             csv_path: str = KEYWORDS_CSV) -> list:
+    """
+    Run the pipeline variants on the labeled set, print a comparison table and
+    append the metrics to the results file for regression tracking.
+
+    Args:
+        variant_names (list): Names of the variants to run (keys of VARIANTS)
+        dataset_dir (str): Directory containing one sub-directory per major
+        results_path (str): JSONL file storing the metrics of every run
+        csv_path (str): Path to the keywords CSV
+
+    Returns:
+        list: One record per variant
+    """
+    labeled_set, skipped = build_labeled_set(dataset_dir, csv_path)
+    print(f"{len(labeled_set)} labeled documents in {dataset_dir} ({skipped} left out)")
+
+    previous = load_previous_results(results_path)
+    version = code_version()
+    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    records = []
+    for name in variant_names:
+        print(f"\nRunning variant: {name}")
+        metrics = run_variant_isolated(VARIANTS[name], labeled_set, csv_path)
+        records.append({
+            "variant": name,
+            "options": VARIANTS[name],
+            "version": version,
+            "timestamp": timestamp,
+            "skipped_documents": skipped,
+            **metrics
+        })
+
+    print(f"\n{'Variant':<20}{'Top-1':>14}{'Top-3':>14}{'Docs/s':>16}{'Peak MB':>18}{'Tools MB':>18}")
+    for record in records:
+        last = previous.get(record["variant"])
+        peak = record["peak_rss_mb"]
+        peak_children = record["peak_children_rss_mb"]
+        print(f"{record['variant']:<20}"
+              f"{record['top1_accuracy']:>7.2f}{format_delta(record['top1_accuracy'], last, 'top1_accuracy'):>7}"
+              f"{record['top3_accuracy']:>7.2f}{format_delta(record['top3_accuracy'], last, 'top3_accuracy'):>7}"
+              f"{record['docs_per_sec']:>8.2f}{format_delta(record['docs_per_sec'], last, 'docs_per_sec'):>8}"
+              f"{(peak if peak is not None else float('nan')):>9.1f}{format_delta(peak, last, 'peak_rss_mb'):>9}"
+              f"{(peak_children if peak_children is not None else float('nan')):>9.1f}"
+              f"{format_delta(peak_children, last, 'peak_children_rss_mb'):>9}")
+    if previous:
+        print("\nDeltas in parentheses are relative to the last stored run of each variant.")
+
+    with open(results_path, 'a', encoding='utf-8') as file:
+        for record in records:
+            file.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    return records
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare accuracy and speed of classifier configurations.")
+    parser.add_argument("variants", nargs="*", help=f"Variants to run among {', '.join(VARIANTS)} (default: all)")
+    parser.add_argument("--dataset", default=DATASET_DIR, help="Directory with one sub-directory per major")
+    parser.add_argument("-o", "--output", default=RESULTS_PATH, help="JSONL file storing the results")
+    args = parser.parse_args()
+    unknown = [name for name in args.variants if name not in VARIANTS]
+    if unknown:
+        parser.error(f"unknown variants: {', '.join(unknown)}")
+
+    # Check nltk install
+    verify_nltk_data()
+
+    evaluate(args.variants or list(VARIANTS), args.dataset, args.output)
+
+if __name__ == "__main__":
+    main()
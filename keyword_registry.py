@@ -0,0 +1,124 @@
+import csv
+import hashlib
+import os
+import subprocess
+from collections import defaultdict
+from functools import lru_cache
+from text_preprocessor import preprocess_keywords
+
+KEYWORDS_CSV = "majors_keywords.csv"
+DEGREE_KEYWORDS = ["MASTER", "BACHELOR", "MASTÈRE", "MBA"]
+
+# Contract types and their keywords
+TYPES_CONTRATS = {
+    "Stage": ["stage", "stagiaire"],
+    "Alternance": ["alternant", "alternance", "apprenti", "apprentie", "alternante"]
+}
+
+def load_keywords_from_csv(csv_path: str) -> dict:
+    """
+    Load keywords from CSV file and organize them by major.
+
+    Args:
+        csv_path (str): Path to the CSV file
+
+    Returns:
+        dict: Dictionary with majors as keys and lists of keywords as values
+    """
+    majeures = defaultdict(list)
+
+    with open(csv_path, 'r', encoding='utf-8') as file:
+        reader = csv.DictReader(file)
+        for row in reader:
+            # Process each keyword
+            keyword = row['Keyword'].strip()
+            processed_keywords = preprocess_keywords([keyword])
+            if processed_keywords:  # Only add if not empty after preprocessing
+                majeures[row['Major']].extend(processed_keywords)
+
+    return dict(majeures)
+
+def archive_path_parts(classification_name: str, keywords: list = DEGREE_KEYWORDS) -> list:
+    """
+    Compute the archive sub-directories of a classification, relative to
+    OFFRES/<TYPE_CONTRAT>.
+
+    Args:
+        classification_name (str): Name of the major (e.g. "ESILV MASTER FINTECH")
+        keywords (list): Degree keywords splitting the school from the major name
+
+    Returns:
+        list: One tuple of directory names per degree keyword found in the name
+    """
+    classification_parts = classification_name.upper().split()
+    paths = []
+
+    for keyword in keywords:
+        if keyword in classification_parts:
+            keyword_index = classification_parts.index(keyword)
+            classification_sub_name = "_".join(classification_parts[keyword_index + 1:])
+            paths.append((
+                *classification_parts[:keyword_index],
+                classification_parts[keyword_index],
+                classification_sub_name.upper()
+            ))
+
+    return paths
+
+@lru_cache(maxsize=4)
+def _build_registry(csv_path: str, mtime_ns: int) -> dict:
+    # mtime_ns is only part of the cache key: editing the CSV invalidates the entry
+    majors = []
+    with open(csv_path, 'r', encoding='utf-8') as file:
+        for row in csv.DictReader(file):
+            major = (row['Major'] or "").strip()
+            if major and major not in majors:
+                majors.append(major)
+
+    return {
+        "majors": majors,
+        "archive_paths": {major.upper(): archive_path_parts(major) for major in majors},
+        "keywords": load_keywords_from_csv(csv_path),
+    }
+
+def get_registry(csv_path: str = KEYWORDS_CSV) -> dict:
+    """
+    Return the majors registry built from the keywords CSV, cached per process
+    and rebuilt only when the file modification time changes.
+
+    Args:
+        csv_path (str): Path to the CSV file
+
+    Returns:
+        dict: "majors" (list of majors in file order), "archive_paths" (upper-cased
+        major -> list of archive sub-directory tuples) and "keywords" (major ->
+        preprocessed keywords)
+    """
+    csv_path = os.path.abspath(csv_path)
+    return _build_registry(csv_path, os.stat(csv_path).st_mtime_ns)
+
+def code_version() -> str:
+    """
+    Return the git revision of the classifier code, or "unknown" outside a
+    git checkout.
+    """
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def model_version(csv_path: str = KEYWORDS_CSV) -> str:
+    """
+    Identify the classification model: a hash of the keywords CSV content
+    followed by the code revision, so that editing either changes the version.
+
+    Args:
+        csv_path (str): Path to the CSV file
+
+    Returns:
+        str: "<csv hash>-<git revision>"
+    """
+    with open(csv_path, 'rb') as file:
+        csv_hash = hashlib.sha256(file.read()).hexdigest()[:12]
+    return f"{csv_hash}-{code_version()}"
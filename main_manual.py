@@ -1,45 +1,15 @@
 # main.py
-import csv
-from collections import defaultdict
 from document_classifier import classify_pdfs_in_directory
-from text_preprocessor import preprocess_keywords, verify_nltk_data
+from keyword_registry import TYPES_CONTRATS, get_registry
+from text_preprocessor import verify_nltk_data
 import os
 
-def load_keywords_from_csv(csv_path: str) -> dict:
-    """
-    Load keywords from CSV file and organize them by major.
-    
-    Args:
-        csv_path (str): Path to the CSV file
-        
-    Returns:
-        dict: Dictionary with majors as keys and lists of keywords as values
-    """
-    majeures = defaultdict(list)
-    
-    with open(csv_path, 'r', encoding='utf-8') as file:
-        reader = csv.DictReader(file)
-        for row in reader:
-            # Process each keyword
-            keyword = row['Keyword'].strip()
-            processed_keywords = preprocess_keywords([keyword])
-            if processed_keywords:  # Only add if not empty after preprocessing
-                majeures[row['Major']].extend(processed_keywords)
-    
-    return dict(majeures)
-
 def main():
     # Check nltk install
     verify_nltk_data()
     
-    # Define contract types
-    types_contrats = {
-        "Stage": ["stage", "stagiaire"],
-        "Alternance": ["alternant", "alternance", "apprenti", "apprentie", "alternante"]
-    }
-    
     # Load majors and their keywords from CSV
-    majeures = load_keywords_from_csv('majors_keywords.csv')
+    majeures = get_registry()['keywords']
     
     # Example usage
     path = "offers"
@@ -49,7 +19,7 @@ def main():
     except Exception as e:
         print(f"The path {directory_path} doesn't exist: {e}")
 
-    results = classify_pdfs_in_directory(directory_path, majeures, types_contrats)
+    results = classify_pdfs_in_directory(directory_path, majeures, TYPES_CONTRATS)
     
     # Summary of results
     print("\nSummary:")
@@ -3,6 +3,18 @@ import re
 from pdf2image import convert_from_path
 import pytesseract
 
+def pdf_title(pdf_path: str) -> str:
+    """
+    Clean the file name of a PDF so that it can be classified like its text.
+    
+    Args:
+        pdf_path (str): Path to the PDF file
+        
+    Returns:
+        str: File name without punctuation
+    """
+    return re.sub(r'[^\w\s+]|_', '', pdf_path.split('/')[-1])
+
 def pdf_to_text_via_ocr(pdf_path: str, language: str ='fra') -> str:
     """
     Convert image-based PDF to text using OCR.
@@ -26,8 +38,7 @@ def pdf_to_text_via_ocr(pdf_path: str, language: str ='fra') -> str:
             text = re.sub(r'[^\w\s+]|_', '', text)
             extracted_text += text
 
-        title = re.sub(r'[^\w\s+]|_', '', pdf_path.split('/')[-1])
-        extracted_text = title + "\n" + extracted_text
+        extracted_text = pdf_title(pdf_path) + "\n" + extracted_text
 
         return extracted_text
     except Exception as e:
@@ -42,7 +53,7 @@ def extract_text_from_pdf(pdf_path: str) -> str:
         pdf_path (str): Path to the PDF file
         
     Returns:
-        str: Extracted text content in lowercase
+        str: Extracted text content in lowercase, empty if the PDF has no text layer
     """
     text = ""
     cleaned_text = ""
@@ -55,8 +66,11 @@ def extract_text_from_pdf(pdf_path: str) -> str:
                   text = re.sub(r'[^\w\s+]|_', '', text)
                   cleaned_text += text + "\n"
 
-        title = re.sub(r'[^\w\s+]|_', '', pdf_path.split('/')[-1])
-        cleaned_text = title + "\n" + cleaned_text
+        # No text layer (scanned PDF): let the caller fall back to OCR
+        if not cleaned_text.strip():
+            return ""
+
+        cleaned_text = pdf_title(pdf_path) + "\n" + cleaned_text
         return cleaned_text
     except Exception as e:
         print(f"Erreur : {e}")
@@ -3,6 +3,7 @@ from nltk.corpus import stopwords
 from nltk.stem import WordNetLemmatizer
 from nltk.data import find
 import unicodedata
+import re
 
 
 def verify_nltk_data() -> None:
@@ -24,13 +25,15 @@ def verify_nltk_data() -> None:
             print(f"Downloading {package}...")
             nltk.download(package)  # Télécharge le package s'il n'est pas trouvé
 
-def preprocess_text(text: str) -> list:
+def preprocess_text(text: str, tokenizer: str = 'nltk') -> list:
     """
     Clean and preprocess text by converting to lowercase, removing stopwords,
     and applying lemmatization.
 
     Args:
         text (str): Input text to process
+        tokenizer (str): 'nltk' for nltk.word_tokenize, 'regex' for a faster
+            split on word characters
 
     Returns:
         list: Processed tokens
@@ -40,7 +43,7 @@ def preprocess_text(text: str) -> list:
     stop_words = set(stopwords.words('french'))
 
     # Tokenize and process text
-    tokens = nltk.word_tokenize(text)
+    tokens = re.findall(r'\w+', text) if tokenizer == 'regex' else nltk.word_tokenize(text)
     filtered_tokens = [word for word in tokens if word.isalpha() and word.lower() not in stop_words]
     normalized_tokens = [normalize_text(word) for word in filtered_tokens]
     lemmatized_tokens = [lemmatizer.lemmatize(word) for word in normalized_tokens]